@@ -1,3 +1,6 @@
+from collections import Counter
+from functools import lru_cache
+
 import esphome.codegen as cg
 import esphome.config_validation as cv
 from esphome.const import CONF_ID, CONF_LAMBDA
@@ -21,11 +24,28 @@ CONF_HEADER_CONTENT_DISPOSITION = "content_disposition"
 CONF_HEADER_CACHE_CONTROL = "cache_control"
 CONF_HEADER_CONNECTION = "connection"
 
+# Shared defaults, built once at import so the schema below can reference them
+# without re-allocating the list on every schema construction.
+_DEFAULT_HEADERS = [
+    "Cache-Control: no-cache",
+    "Connection: close",
+]
+
+
+# Signature of the route lambdas; invariant across routes and configs, so
+# built once instead of per process_lambda call.
+_LAMBDA_PARAMS = [(WebServerRoutes.operator("ref"), "it")]
+
+# RawExpression is immutable, so one shared nullptr serves every route
+# without a lambda.
+_NULLPTR = cg.RawExpression("nullptr")
+
 
+@lru_cache(maxsize=256)
 def normalize_path(path: str) -> str:
     if not path:
         return "/"
-    return "/" + path.strip("/")
+    return f"/{path.strip('/')}"
 
 
 def _validate_routes(config):
@@ -33,49 +53,54 @@ def _validate_routes(config):
     routes = config.get(CONF_ROUTES, [])
     global_path = config.get(CONF_PATH)
 
-    seen = set()
+    # A route is unique based on its final path AND its key. Fill in the
+    # path default and collect the identifiers in one pass over the routes,
+    # then report every duplicate at once instead of stopping at the first
+    # collision.
+    identifiers = []
+    add_identifier = identifiers.append  # hoist the method lookup out of the loop
     for route in routes:
-
         if CONF_PATH not in route:
             route[CONF_PATH] = global_path
+        add_identifier(
+            (normalize_path(route[CONF_PATH]), route.get(CONF_QUERY_KEY, ""))
+        )
 
-        key = route.get(CONF_QUERY_KEY, "")
-        path = normalize_path(route[CONF_PATH])
+    counts = Counter(identifiers)
+    duplicates = [identifier for identifier, count in counts.items() if count > 1]
+    if duplicates:
+        raise cv.Invalid(
+            "Duplicate routes found: "
+            + ", ".join(f"'{path}' with key '{key}'" for path, key in duplicates)
+        )
 
-        # A route is unique based on its final path AND its key
-        identifier = (path, key)
+    return config
 
-        if identifier in seen:
-            raise cv.Invalid(
-                f"Duplicate route found: Route '{path}' with "
-                f"key '{key}' is defined more than once."
-            )
-        seen.add(identifier)
 
-    return config
+# Route fields split by concern so the schema is composed from reusable
+# field groups instead of one monolithic dict.
+_CORE_ROUTE_FIELDS = {
+    cv.GenerateID(CONF_ID): cv.declare_id(RouteEntry),
+    cv.Optional(CONF_LAMBDA): cv.lambda_,
+    cv.Optional(CONF_PATH): cv.string,
+    cv.Optional(CONF_QUERY_KEY, default=""): cv.string,
+}
 
+_HEADER_ROUTE_FIELDS = {
+    cv.Optional(CONF_HEADERS, default=_DEFAULT_HEADERS): cv.ensure_list(cv.string),
+    cv.Optional(CONF_UNIQUE_HEADER_FIELDS, default=True): cv.boolean,
+    cv.Optional(CONF_HEADER_CACHE_CONTROL, default="no-cache"): cv.string,
+    cv.Optional(CONF_HEADER_CONNECTION, default="close"): cv.string,
+    cv.Optional(CONF_HEADER_CONTENT_TYPE, default=""): cv.string,
+    cv.Exclusive(CONF_HEADER_CONTENT_DISPOSITION, "disposition"): cv.string,
+    cv.Exclusive(CONF_FILENAME, "disposition"): cv.string,
+}
 
-ROUTE_SCHEMA = cv.Schema(
-    {
-        cv.GenerateID(CONF_ID): cv.declare_id(RouteEntry),
-        cv.Optional(CONF_LAMBDA): cv.lambda_,
-        cv.Optional(CONF_PATH): cv.string,
-        cv.Optional(
-            CONF_HEADERS,
-            default=[
-                "Cache-Control: no-cache",
-                "Connection: close",
-            ],
-        ): cv.ensure_list(cv.string),
-        cv.Optional(CONF_UNIQUE_HEADER_FIELDS, default=True): cv.boolean,
-        cv.Optional(CONF_QUERY_KEY, default=""): cv.string,
-        cv.Optional(CONF_HEADER_CACHE_CONTROL, default="no-cache"): cv.string,
-        cv.Optional(CONF_HEADER_CONNECTION, default="close"): cv.string,
-        cv.Optional(CONF_HEADER_CONTENT_TYPE, default=""): cv.string,
-        cv.Exclusive(CONF_HEADER_CONTENT_DISPOSITION, "disposition"): cv.string,
-        cv.Exclusive(CONF_FILENAME, "disposition"): cv.string,
-    }
-)
+ROUTE_SCHEMA = cv.Schema({**_CORE_ROUTE_FIELDS, **_HEADER_ROUTE_FIELDS})
+
+# Compile the per-route list validator once at import; cv.ensure_list wraps
+# ROUTE_SCHEMA in a new validator each time it is called.
+_ROUTES_VALIDATOR = cv.ensure_list(ROUTE_SCHEMA)
 
 CONFIG_SCHEMA = cv.All(
     cv.Schema(
@@ -85,7 +110,7 @@ CONFIG_SCHEMA = cv.All(
                 web_server_base.WebServerBase
             ),
             cv.Optional(CONF_PATH, default="download"): cv.string,
-            cv.Required(CONF_ROUTES): cv.ensure_list(ROUTE_SCHEMA),
+            cv.Required(CONF_ROUTES): _ROUTES_VALIDATOR,
         }
     ).extend(cv.COMPONENT_SCHEMA),
     _validate_routes,
@@ -96,29 +121,50 @@ async def to_code(config):
     var = cg.new_Pvariable(config[CONF_ID])
     await cg.register_component(var, config)
 
-    base = await cg.get_variable(config[CONF_WEB_SERVER_BASE_ID])
-    cg.add(var.set_web_server_base(base))
-
-    # Sort routes to ensure specific keys are matched before generic empty-key
-    config[CONF_ROUTES].sort(key=lambda x: (x.get(CONF_QUERY_KEY, "") == "",))
+    # cg.add is called for every emitted statement below; bind it once.
+    add = cg.add
 
-    for route_conf in config[CONF_ROUTES]:
-
-        unique_hf = route_conf[CONF_UNIQUE_HEADER_FIELDS]
-        cg.add(var.set_unique_header_fields(unique_hf))
+    base = await cg.get_variable(config[CONF_WEB_SERVER_BASE_ID])
+    add(var.set_web_server_base(base))
+
+    # Bind the routes list once; every later step works on this local instead
+    # of re-indexing into config.
+    routes = config[CONF_ROUTES]
+
+    # unique_header_fields is a single flag on the component, so emitting the
+    # setter per route only produced redundant statements with last-wins
+    # semantics. Emit it once with the value that won under the original
+    # emission order, where empty-key routes were partitioned to the end:
+    # the last empty-key route in config order, or the last route overall
+    # when every route has a key. Computed before the path sort below so
+    # the dispatch reordering cannot change the effective value.
+    if routes:
+        empty_key_routes = [r for r in routes if r.get(CONF_QUERY_KEY, "") == ""]
+        unique_hf = (empty_key_routes or routes)[-1][CONF_UNIQUE_HEADER_FIELDS]
+        add(var.set_unique_header_fields(unique_hf))
+
+    # Emit routes ordered by path, with specific keys ahead of the generic
+    # empty-key entry for the same path. add_route() keeps this ordering on
+    # the C++ side, where the request handler binary-searches by path.
+    routes = sorted(
+        routes,
+        key=lambda r: (normalize_path(r[CONF_PATH]), r.get(CONF_QUERY_KEY, "") == ""),
+    )
+
+    for route_conf in routes:
 
         route_id = route_conf[CONF_ID]
         path = normalize_path(route_conf[CONF_PATH])
         key = route_conf.get(CONF_QUERY_KEY, "")
 
-        lambda_code = cg.RawExpression("nullptr")
-
         if CONF_LAMBDA in route_conf:
             lambda_code = await cg.process_lambda(
                 route_conf[CONF_LAMBDA],
-                [(WebServerRoutes.operator("ref"), "it")],
+                _LAMBDA_PARAMS,
                 return_type=cg.void,
             )
+        else:
+            lambda_code = _NULLPTR
 
         route_var = cg.new_Pvariable(
             route_id,
@@ -132,20 +178,24 @@ async def to_code(config):
         header_connection = route_conf.get(CONF_HEADER_CONNECTION, "")
         header_content_type = route_conf.get(CONF_HEADER_CONTENT_TYPE, "")
 
-        header_content_disposition = ""
-        if CONF_FILENAME in route_conf:
-            header_content_disposition = (
-                f'attachment; filename="{route_conf[CONF_FILENAME]}"'
+        filename = route_conf.get(CONF_FILENAME)
+        if filename is not None:
+            header_content_disposition = f'attachment; filename="{filename}"'
+        else:
+            header_content_disposition = route_conf.get(
+                CONF_HEADER_CONTENT_DISPOSITION, ""
             )
-        elif CONF_HEADER_CONTENT_DISPOSITION in route_conf:
-            header_content_disposition = route_conf[CONF_HEADER_CONTENT_DISPOSITION]
 
-        cg.add(var.add_route(route_var))
-        cg.add(route_var.add_header("Cache-Control", header_cache_controle))
-        cg.add(route_var.add_header("Connection", header_connection))
-        cg.add(route_var.add_header("Content-Type", header_content_type))
-        cg.add(route_var.add_header("Content-Disposition", header_content_disposition))
+        add(var.add_route(route_var))
+        add(
+            route_var.set_standard_headers(
+                header_cache_controle,
+                header_connection,
+                header_content_type,
+                header_content_disposition,
+            )
+        )
 
         if CONF_HEADERS in route_conf:
             for header_string in route_conf[CONF_HEADERS]:
-                cg.add(route_var.set_header(header_string))  # Add or update
+                add(route_var.set_header(header_string))  # Add or update
@@ -15,6 +15,7 @@
 #include "esphome/core/log.h"
 #include "esphome/components/web_server_base/web_server_base.h"
 #include "esphome/components/web_server_idf/web_server_idf.h"
+#include <algorithm>
 #include <cstring>
 #include <esp_http_server.h>
 #include <functional>
@@ -30,7 +31,14 @@ WebServerRoutes::RouteEntry *WebServerRoutes::add_route(WebServerRoutes::RouteEn
   if (route == nullptr)
     return nullptr;
 
-  this->routes_.push_back(std::unique_ptr<WebServerRoutes::RouteEntry>(route));
+  // Keep routes_ sorted by path so the request handler can binary-search.
+  // upper_bound preserves insertion order within one path, which keeps
+  // specific-key routes ahead of the generic empty-key entry.
+  auto pos = std::upper_bound(this->routes_.begin(), this->routes_.end(), route->path,
+                              [](const std::string &path, const std::unique_ptr<RouteEntry> &entry) {
+                                return path < entry->path;
+                              });
+  this->routes_.insert(pos, std::unique_ptr<WebServerRoutes::RouteEntry>(route));
   return route;
 }
 
@@ -17,6 +17,7 @@
 #include "esphome/components/web_server_base/web_server_base.h"
 #include "esphome/components/web_server_idf/web_server_idf.h"
 #include <esp_http_server.h>
+#include <algorithm>
 #include <functional>
 #include <list>
 #include <optional>
@@ -59,6 +60,21 @@ class WebServerRoutes : public Component {
       set_content_disposition(content_disposition);
     }
 
+    void set_standard_headers(std::string cache_control, std::string connection, std::string content_type,
+                              std::string content_disposition) {
+      // Shared literals so the generated code does not duplicate the header
+      // names once per route in flash.
+      static const char CACHE_CONTROL[] = "Cache-Control";
+      static const char CONNECTION[] = "Connection";
+      static const char CONTENT_TYPE[] = "Content-Type";
+      static const char CONTENT_DISPOSITION[] = "Content-Disposition";
+
+      add_header(CACHE_CONTROL, std::move(cache_control));
+      add_header(CONNECTION, std::move(connection));
+      add_header(CONTENT_TYPE, std::move(content_type));
+      add_header(CONTENT_DISPOSITION, std::move(content_disposition));
+    }
+
     std::string get_header(std::string field) {
       for (const auto &item : this->headers) {
         if (esphome::str_lower_case(item.first) == esphome::str_lower_case(field)) {
@@ -143,19 +159,31 @@ class WebServerRoutes : public Component {
 
     bool canHandle(esphome::web_server_idf::AsyncWebServerRequest *request) const override {
       std::string url = request->url();
-      for (auto &route_ptr : this->parent_->routes_) {
-        auto &route = *route_ptr;
-        if (url == route.path || url == route.path + "/") {
-          if (route.key.empty() || request->hasParam(route.key)) {
-            // Log handled route
-            ESP_LOGI(TAG, "Path: %s", url.c_str());
-            if (!route.key.empty()) {
-              ESP_LOGI(TAG, "Key: %s", route.key.c_str());
-            }
-
-            this->matched_route_ = &route;
-            return true;
+
+      // Normalize away a single trailing slash so "/a/" matches route "/a".
+      if (url.size() > 1 && url.back() == '/') {
+        url.pop_back();
+      }
+
+      // routes_ is kept sorted by path (see add_route), so locate the block
+      // of routes for this path with a binary search instead of scanning the
+      // whole list on every request.
+      auto &routes = this->parent_->routes_;
+      auto it = std::lower_bound(routes.begin(), routes.end(), url,
+                                 [](const std::unique_ptr<RouteEntry> &entry, const std::string &u) {
+                                   return entry->path < u;
+                                 });
+      for (; it != routes.end() && (*it)->path == url; ++it) {
+        auto &route = **it;
+        if (route.key.empty() || request->hasParam(route.key)) {
+          // Log handled route
+          ESP_LOGI(TAG, "Path: %s", url.c_str());
+          if (!route.key.empty()) {
+            ESP_LOGI(TAG, "Key: %s", route.key.c_str());
           }
+
+          this->matched_route_ = &route;
+          return true;
         }
       }
       this->matched_route_ = nullptr;